@@ -64,6 +64,8 @@ class DocReaderConfig:
     ocr_api_base_url: str
     ocr_api_key: str
     ocr_model: str
+    ocr_max_concurrency: int
+    ocr_rps: int
 
     # VLM Caption
     vlm_model_base_url: str
@@ -92,6 +94,14 @@ class DocReaderConfig:
 
     local_storage_base_dir: str
 
+    # Cache
+    cache_dir: str
+    doc_cache_max_bytes: int
+    ocr_cache_max_bytes: int
+
+    # Document conversion
+    soffice_workers: int
+
     # Other
     mineru_endpoint: str
 
@@ -130,6 +140,10 @@ def load_config() -> DocReaderConfig:
     ocr_api_base_url = _get_str(["DOCREADER_OCR_API_BASE_URL", "OCR_API_BASE_URL"], "")
     ocr_api_key = _get_str(["DOCREADER_OCR_API_KEY", "OCR_API_KEY"], "")
     ocr_model = _get_str(["DOCREADER_OCR_MODEL", "OCR_MODEL"], "")
+    ocr_max_concurrency = _get_int(
+        ["DOCREADER_OCR_MAX_CONCURRENCY", "OCR_MAX_CONCURRENCY"], 8
+    )
+    ocr_rps = _get_int(["DOCREADER_OCR_RPS", "OCR_RPS"], 5)
 
     # VLM Caption
     vlm_model_base_url = _get_str(
@@ -179,6 +193,22 @@ def load_config() -> DocReaderConfig:
     # Local storage
     local_storage_base_dir = "./data/files"
 
+    # Cache
+    cache_dir = _get_str(["DOCREADER_CACHE_DIR", "CACHE_DIR"], "")
+    doc_cache_max_bytes = (
+        _get_int(["DOCREADER_DOC_CACHE_MAX_SIZE_MB", "DOC_CACHE_MAX_SIZE_MB"], 1024)
+        * 1024
+        * 1024
+    )
+    ocr_cache_max_bytes = (
+        _get_int(["DOCREADER_OCR_CACHE_MAX_SIZE_MB", "OCR_CACHE_MAX_SIZE_MB"], 256)
+        * 1024
+        * 1024
+    )
+
+    # Document conversion
+    soffice_workers = _get_int(["DOCREADER_SOFFICE_WORKERS", "SOFFICE_WORKERS"], 2)
+
     # Other
     mineru_endpoint = _get_str(["DOCREADER_MINERU_ENDPOINT", "MINERU_ENDPOINT"], "")
 
@@ -193,6 +223,8 @@ def load_config() -> DocReaderConfig:
         ocr_api_base_url=ocr_api_base_url,
         ocr_api_key=ocr_api_key,
         ocr_model=ocr_model,
+        ocr_max_concurrency=ocr_max_concurrency,
+        ocr_rps=ocr_rps,
         vlm_model_base_url=vlm_model_base_url,
         vlm_model_name=vlm_model_name,
         vlm_model_api_key=vlm_model_api_key,
@@ -213,6 +245,10 @@ def load_config() -> DocReaderConfig:
         minio_public_endpoint=minio_public_endpoint,
         minio_use_ssl=minio_use_ssl,
         local_storage_base_dir=local_storage_base_dir,
+        cache_dir=cache_dir,
+        doc_cache_max_bytes=doc_cache_max_bytes,
+        ocr_cache_max_bytes=ocr_cache_max_bytes,
+        soffice_workers=soffice_workers,
         mineru_endpoint=mineru_endpoint,
     )
 
@@ -239,6 +275,8 @@ def dump_config(mask_secrets: bool = True) -> Dict[str, Any]:
         if mask_secrets
         else cfg.ocr_api_key,
         "DOCREADER_OCR_MODEL": cfg.ocr_model,
+        "DOCREADER_OCR_MAX_CONCURRENCY": cfg.ocr_max_concurrency,
+        "DOCREADER_OCR_RPS": cfg.ocr_rps,
         # VLM
         "DOCREADER_VLM_MODEL_BASE_URL": cfg.vlm_model_base_url,
         "DOCREADER_VLM_MODEL_NAME": cfg.vlm_model_name,
@@ -271,6 +309,12 @@ def dump_config(mask_secrets: bool = True) -> Dict[str, Any]:
         "DOCREADER_MINIO_PUBLIC_ENDPOINT": cfg.minio_public_endpoint,
         "DOCREADER_MINIO_USE_SSL": cfg.minio_use_ssl,
         "DOCREADER_LOCAL_STORAGE_BASE_DIR": cfg.local_storage_base_dir,
+        # Cache
+        "DOCREADER_CACHE_DIR": cfg.cache_dir,
+        "DOCREADER_DOC_CACHE_MAX_SIZE_MB": cfg.doc_cache_max_bytes // (1024 * 1024),
+        "DOCREADER_OCR_CACHE_MAX_SIZE_MB": cfg.ocr_cache_max_bytes // (1024 * 1024),
+        # Document conversion
+        "DOCREADER_SOFFICE_WORKERS": cfg.soffice_workers,
         # Other
         "DOCREADER_MINERU_ENDPOINT": cfg.mineru_endpoint,
     }
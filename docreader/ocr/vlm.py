@@ -1,19 +1,120 @@
+import asyncio
+import base64
+import contextlib
+import functools
+import hashlib
+import io
 import logging
-from typing import Union
+import mmap
+import os
+import tempfile
+import threading
+import time
+from typing import AsyncIterator, List, Optional, Tuple, Union
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from PIL import Image
 
 from docreader.config import CONFIG
 from docreader.ocr.base import OCRBackend
-from docreader.utils import endecode
+from docreader.utils.cache import cache_dir, evict_lru
 
 logger = logging.getLogger(__name__)
 
+# Cache subdirectory of persisted OCR results, keyed by image content hash
+_OCR_CACHE_NAME = "vlm_ocr"
+# Seconds between two mtime refreshes of a cache entry on hits
+_OCR_CACHE_TOUCH_INTERVAL = 60
+
+# Leading magic bytes of common image formats, used to pick the data URL MIME type
+_IMAGE_SIGNATURES = (
+    (b"\x89PNG", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+)
+
+
+def _sniff_mime(data) -> str:
+    """Guess the image MIME type from the leading bytes, defaulting to PNG"""
+    head = bytes(data[:12])
+    for signature, mime in _IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return mime
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+@functools.lru_cache(maxsize=256)
+def _load_cached_text(key: str) -> str:
+    """Read a cached OCR result from disk
+
+    Misses raise FileNotFoundError, which lru_cache does not memoize,
+    so only hits are kept in memory.
+    """
+    return (cache_dir(_OCR_CACHE_NAME) / f"{key}.md").read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _touch_cached_text(key: str, period: int) -> None:
+    """Refresh the mtime of a cache entry, at most once per key and period
+
+    Hits served from memory touch the entry too, otherwise eviction would
+    drop the hottest entries first.
+    """
+    with contextlib.suppress(OSError):
+        os.utime(cache_dir(_OCR_CACHE_NAME) / f"{key}.md")
+
+
+def _get_cached_text(key: str) -> Optional[str]:
+    """Look up a cached OCR result, returning None on a miss or when disabled"""
+    if CONFIG.ocr_cache_max_bytes <= 0:
+        return None
+    try:
+        text = _load_cached_text(key)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Failed to read VLM OCR cache: {str(e)}")
+        return None
+    _touch_cached_text(key, int(time.monotonic() // _OCR_CACHE_TOUCH_INTERVAL))
+    logger.info(f"VLM OCR cache hit: {key}")
+    return text
+
+
+def _store_cached_text(key: str, text: str) -> None:
+    """Atomically persist an OCR result to the disk cache, evicting old entries"""
+    data = text.encode("utf-8")
+    if len(data) > CONFIG.ocr_cache_max_bytes:
+        return
+    directory = cache_dir(_OCR_CACHE_NAME)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, directory / f"{key}.md")
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    evict_lru(directory, ".md", len(data), CONFIG.ocr_cache_max_bytes)
+
 
 class VLMOCRBackend(OCRBackend):
     """VLM OCR backend implementation using OpenAI API format"""
 
+    # Process-wide cap on in-flight API calls
+    _inflight = threading.BoundedSemaphore(max(1, CONFIG.ocr_max_concurrency))
+    # Token bucket state: minimum interval between two API calls
+    _rate_lock = threading.Lock()
+    _next_allowed_ts = 0.0
+    _min_interval = 1.0 / max(1, CONFIG.ocr_rps)
+
+    # Shared API client, lazily created by _get_client
+    _client: Optional[OpenAI] = None
+    _client_lock = threading.Lock()
+
     def __init__(self):
         """Initialize VLM OCR backend
 
@@ -23,11 +124,6 @@ class VLMOCRBackend(OCRBackend):
             model: Model name
         """
         self.model = CONFIG.ocr_model
-        self.client = OpenAI(
-            api_key=CONFIG.ocr_api_key,
-            base_url=CONFIG.ocr_api_base_url,
-            timeout=30,
-        )
         self.temperature = 0.0
         self.max_tokens = 5000
 
@@ -38,50 +134,303 @@ class VLMOCRBackend(OCRBackend):
         "文档中公式用latex格式表示，"
         "按照阅读顺序组织进行解析。"
 
+    @classmethod
+    def _get_client(cls) -> OpenAI:
+        """Get the OpenAI client shared by all VLM OCR calls
+
+        The client keeps a pooled httpx transport, so TCP/TLS connections are
+        reused across calls instead of being re-established per backend.
+        """
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    cls._client = OpenAI(
+                        http_client=httpx.Client(limits=cls._pool_limits()),
+                        **cls._client_options(),
+                    )
+        return cls._client
+
+    @classmethod
+    def create_async_client(cls) -> AsyncOpenAI:
+        """Create an async client to share across apredict calls
+
+        Async connection pools are bound to the event loop that uses them,
+        so unlike the sync client this one is not shared process-wide. Use it
+        as an async context manager so its pool is closed afterwards.
+        """
+        return AsyncOpenAI(
+            http_client=httpx.AsyncClient(limits=cls._pool_limits()),
+            **cls._client_options(),
+        )
+
+    @staticmethod
+    def _client_options() -> dict:
+        """Options shared by the sync and async API clients"""
+        return {
+            "api_key": CONFIG.ocr_api_key,
+            "base_url": CONFIG.ocr_api_base_url,
+            "timeout": httpx.Timeout(30.0, connect=10.0, pool=10.0),
+            # Retries 429/5xx responses with exponential backoff
+            "max_retries": 3,
+        }
+
+    @staticmethod
+    def _pool_limits() -> httpx.Limits:
+        """Connection pool sized to the in-flight request cap"""
+        pool_size = max(1, CONFIG.ocr_max_concurrency)
+        return httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=30.0,
+        )
+
+    @classmethod
+    def _reserve_request_slot(cls) -> float:
+        """Reserve the next slot of the token bucket
+
+        Returns:
+            Seconds to wait before the request may be issued
+        """
+        with cls._rate_lock:
+            now = time.monotonic()
+            slot = max(now, cls._next_allowed_ts)
+            cls._next_allowed_ts = slot + cls._min_interval
+            return slot - now
+
+    def _prepare(
+        self, image: Union[str, bytes, Image.Image]
+    ) -> Tuple[str, Optional[str], str, str]:
+        """Hash an image and, on a cache miss, encode it for the data URL
+
+        Hashing and encoding share one pass over the image bytes: files are
+        mapped once, and encoded PIL bytes are read without copying them out.
+
+        Args:
+            image: Image file path, bytes, or PIL Image object
+
+        Returns:
+            Tuple of (cache key, cached text or None, MIME type, base64 string);
+            the MIME type and base64 string are empty on a cache hit
+        """
+        if isinstance(image, bytes):
+            return self._prepare_buffer(image)
+
+        if isinstance(image, str):
+            with open(image, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return "", None, "image/png", ""
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._prepare_buffer(mm)
+
+        if isinstance(image, Image.Image):
+            parts = [image.tobytes(), f"{image.mode}{image.size}".encode()]
+            # Palette images store indices only, the colors live in the palette
+            palette = image.getpalette()
+            if palette is not None:
+                parts.append(bytes(palette))
+            cache_key = self._cache_key(*parts)
+            text = _get_cached_text(cache_key)
+            if text is not None:
+                return cache_key, text, "", ""
+
+            # Use original format if available, otherwise default to PNG
+            img_format = image.format or "PNG"
+            buffer = io.BytesIO()
+            image.save(buffer, format=img_format)
+            # getbuffer() exposes the encoded bytes without copying them out
+            with buffer.getbuffer() as view:
+                img_base64 = base64.b64encode(view).decode("ascii")
+            mime = Image.MIME.get(img_format.upper(), "image/png")
+            return cache_key, None, mime, img_base64
+
+        raise ValueError(f"Unsupported image type: {type(image)}")
+
+    def _prepare_buffer(self, data) -> Tuple[str, Optional[str], str, str]:
+        """Hash and, on a cache miss, encode raw image bytes or a mapped file"""
+        cache_key = self._cache_key(data)
+        text = _get_cached_text(cache_key)
+        if text is not None:
+            return cache_key, text, "", ""
+        img_base64 = base64.b64encode(data).decode("ascii")
+        return cache_key, None, _sniff_mime(data), img_base64
+
+    def _build_messages(self, mime: str, img_base64: str) -> list:
+        """Build the OpenAI-compatible chat messages for one image"""
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:{mime};base64,{img_base64}"},
+                    },
+                    {
+                        "type": "text",
+                        "text": self.prompt,
+                    },
+                ],
+            }
+        ]
+
+    def _create_completion(self, mime: str, img_base64: str) -> str:
+        """Call the OpenAI-compatible chat API, bounded by concurrency and rate limits
+
+        Args:
+            mime: MIME type of the image
+            img_base64: Base64 encoded image
+
+        Returns:
+            Text returned by the model
+        """
+        with self._inflight:
+            delay = self._reserve_request_slot()
+            if delay > 0:
+                time.sleep(delay)
+
+            logger.info(f"Calling VLM OCR API with model: {self.model}")
+            response = self._get_client().chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(mime, img_base64),
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+            )
+        return response.choices[0].message.content or ""
+
+    def _cache_key(self, *parts) -> str:
+        """Compute the cache key of an image from its raw (pre-encode) content
+
+        The model name and prompt are part of the key so that changing either
+        does not serve stale results.
+        """
+        h = hashlib.blake2b(digest_size=32)
+        for part in parts:
+            h.update(part)
+        h.update(f"\0{self.model}\0{self.prompt}".encode())
+        return h.hexdigest()
+
     def predict(self, image: Union[str, bytes, Image.Image]) -> str:
         """Extract text from an image using VLM OCR
 
+        Results are cached by image content, so identical images re-submitted
+        (e.g. when re-ingesting a document) skip both encoding and the API call.
+
         Args:
             image: Image file path, bytes, or PIL Image object
 
         Returns:
             Extracted text
         """
-        if self.client is None:
-            logger.error("VLM OCR client not initialized")
-            return ""
-
         try:
-            # Encode image to base64 format for API transmission
-            img_base64 = endecode.decode_image(image)
+            # Look up the cache, encoding to base64 only on a miss
+            cache_key, text, mime, img_base64 = self._prepare(image)
+            if text is not None:
+                return text
             if not img_base64:
                 return ""
 
             # Call VLM OCR API using OpenAI-compatible format
-            logger.info(f"Calling VLM OCR API with model: {self.model}")
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{img_base64}"
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": self.prompt,
-                            },
-                        ],
-                    }
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
-            return response.choices[0].message.content or ""
+            text = self._create_completion(mime, img_base64)
+            self._save_result(cache_key, text)
+            return text
         except Exception as e:
             logger.error(f"VLM OCR prediction error: {str(e)}")
             return ""
+
+    @contextlib.asynccontextmanager
+    async def _ainflight(self) -> AsyncIterator[None]:
+        """Hold a slot of the process-wide in-flight cap from async code
+
+        The slot is shared with the sync path, so OCR_MAX_CONCURRENCY holds
+        across sync calls and any number of concurrent async batches.
+        """
+        acquire = asyncio.ensure_future(asyncio.to_thread(self._inflight.acquire))
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            # The worker thread still takes the slot, hand it back once it does
+            acquire.add_done_callback(lambda _: self._inflight.release())
+            raise
+        try:
+            yield
+        finally:
+            self._inflight.release()
+
+    async def apredict(
+        self, image: Union[str, bytes, Image.Image], client: AsyncOpenAI
+    ) -> str:
+        """Asynchronously extract text from an image using VLM OCR
+
+        Hashing, encoding and cache writes run in worker threads so they
+        neither block the event loop nor serialize a batch.
+
+        Args:
+            image: Image file path, bytes, or PIL Image object
+            client: Async client to send the request with, see create_async_client
+
+        Returns:
+            Extracted text
+        """
+        try:
+            cache_key, text, mime, img_base64 = await asyncio.to_thread(
+                self._prepare, image
+            )
+            if text is not None:
+                return text
+            if not img_base64:
+                return ""
+
+            async with self._ainflight():
+                # Shares the token bucket with the sync path, so the rate limit
+                # holds across both
+                delay = self._reserve_request_slot()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                logger.info(f"Calling VLM OCR API asynchronously: {self.model}")
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=self._build_messages(mime, img_base64),
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
+            text = response.choices[0].message.content or ""
+            await asyncio.to_thread(self._save_result, cache_key, text)
+            return text
+        except Exception as e:
+            logger.error(f"VLM OCR async prediction error: {str(e)}")
+            return ""
+
+    async def apredict_many(
+        self, images: List[Union[str, bytes, Image.Image]]
+    ) -> List[str]:
+        """Extract text from multiple images concurrently
+
+        Requests share one async client and the process-wide in-flight cap,
+        which suits multi-page documents.
+
+        Args:
+            images: List of image file paths, bytes, or PIL Image objects
+
+        Returns:
+            Extracted texts, in the same order as images
+        """
+        # Bounds the images of this batch in flight at once, so waiting for the
+        # shared cap never ties up more worker threads than the cap itself
+        semaphore = asyncio.Semaphore(max(1, CONFIG.ocr_max_concurrency))
+
+        async with self.create_async_client() as client:
+
+            async def predict_with_limit(image: Union[str, bytes, Image.Image]):
+                async with semaphore:
+                    return await self.apredict(image, client)
+
+            return await asyncio.gather(*(predict_with_limit(i) for i in images))
+
+    def _save_result(self, cache_key: str, text: str) -> None:
+        """Persist a non-empty OCR result, ignoring cache write failures"""
+        if not text:
+            return
+        try:
+            _store_cached_text(cache_key, text)
+        except OSError as e:
+            logger.warning(f"Failed to write VLM OCR cache: {str(e)}")
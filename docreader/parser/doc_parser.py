@@ -1,17 +1,138 @@
+import atexit
+import contextlib
+import functools
+import hashlib
 import logging
 import os
+import queue
+import shutil
 import subprocess
-from typing import List, Optional
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional
 
 import textract
 
 from docreader.config import CONFIG
 from docreader.models.document import Document
 from docreader.parser.docx2_parser import Docx2Parser
-from docreader.utils.tempfile import TempDirContext, TempFileContext
+from docreader.utils.cache import cache_dir, evict_lru, private_dir
+from docreader.utils.tempfile import TempDirContext, TempFileContext, ram_temp_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# SandboxExecutor relies on subprocess taking its posix_spawn path (absolute
+# executable, close_fds=False, no preexec_fn); say so when it cannot
+if sys.platform.startswith("linux") and not getattr(
+    subprocess, "_USE_POSIX_SPAWN", False
+):
+    logger.warning("posix_spawn unavailable, external tools will use fork+exec")
+
+# Leading bytes of a ZIP archive, the container of Office Open XML files
+_ZIP_SIGNATURE = b"PK\x03\x04"
+
+# Cache subdirectory of the soffice profiles, which outlive the process so a
+# restart does not bootstrap them again
+_SOFFICE_PROFILE_CACHE_NAME = "soffice_profiles"
+
+# Cache subdirectory of converted DOCX files, keyed by the hash of their DOC
+_DOCX_CACHE_NAME = "doc_to_docx"
+
+
+def _write_new_file(path: str, content: bytes) -> None:
+    """Write content to a new file with raw os.write calls
+
+    Skips the buffered file object, and the memoryview lets partial writes
+    resume without copying the remaining bytes.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+_conversion_root: Optional[str] = None
+_conversion_root_lock = threading.Lock()
+
+
+def _conversion_tmp_root() -> str:
+    """Shared parent of the per-conversion working directories
+
+    Anything left behind by an interrupted conversion is removed in one go
+    when the process exits. The root is checked on every call, so when it is
+    removed under a long-running service (tmp cleaners, operators) it is
+    recreated, or replaced by a new one if the path was taken over meanwhile.
+    """
+    global _conversion_root
+    with _conversion_root_lock:
+        if _conversion_root is not None:
+            try:
+                private_dir(Path(_conversion_root))
+                return _conversion_root
+            except OSError as e:
+                logger.warning(f"Replacing DOC conversion temp root: {e}")
+        _conversion_root = tempfile.mkdtemp(prefix="doc_parser_")
+        atexit.register(shutil.rmtree, _conversion_root, True)
+        return _conversion_root
+
+
+def _docx_cache_key(content: bytes) -> str:
+    """Cache key of a DOC document, from its content"""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _load_cached_docx(key: str) -> Optional[bytes]:
+    """Read a cached DOCX conversion, returning None on a miss"""
+    if CONFIG.doc_cache_max_bytes <= 0:
+        return None
+    try:
+        path = cache_dir(_DOCX_CACHE_NAME) / f"{key}.docx"
+        docx_content = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Failed to read DOC to DOCX cache: {e}")
+        return None
+    # Touch the entry so that eviction drops the least recently used ones
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    logger.info(f"DOC to DOCX cache hit: {key}")
+    return docx_content
+
+
+def _store_cached_docx(key: str, docx_content: bytes) -> None:
+    """Atomically add a DOCX conversion to the cache, evicting old entries"""
+    if len(docx_content) > CONFIG.doc_cache_max_bytes:
+        return
+    try:
+        directory = cache_dir(_DOCX_CACHE_NAME)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(docx_content)
+            os.replace(tmp_path, directory / f"{key}.docx")
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        evict_lru(
+            directory, ".docx", len(docx_content), CONFIG.doc_cache_max_bytes
+        )
+    except OSError as e:
+        logger.warning(f"Failed to write DOC to DOCX cache: {e}")
+
 
 class SandboxExecutor:
     """Sandbox executor for running commands with proxy configuration"""
@@ -28,11 +149,18 @@ class SandboxExecutor:
         self.proxy = proxy or CONFIG.external_https_proxy or "http://128.0.0.1:1"
         self.default_timeout = default_timeout
 
-    def execute_in_sandbox(self, cmd: List[str]) -> tuple:
+    def execute_in_sandbox(
+        self,
+        cmd: List[str],
+        timeout: Optional[int] = None,
+        capture_stdout: bool = True,
+    ) -> tuple:
         """Execute command in sandbox with proxy configuration
 
         Args:
             cmd: Command to execute
+            timeout: Timeout in seconds, default_timeout if None
+            capture_stdout: Whether to capture stdout, discarded if False
 
         Returns:
             Tuple of (stdout, stderr, returncode)
@@ -44,18 +172,22 @@ class SandboxExecutor:
 
         for method in sandbox_methods:
             try:
-                return method(cmd)
+                return method(cmd, timeout or self.default_timeout, capture_stdout)
             except Exception as e:
                 logger.warning(f"Sandbox method {method.__name__} failed: {e}")
                 continue
 
         raise RuntimeError("All sandbox methods failed")
 
-    def _execute_with_proxy(self, cmd: List[str]) -> tuple:
+    def _execute_with_proxy(
+        self, cmd: List[str], timeout: int, capture_stdout: bool = True
+    ) -> tuple:
         """Execute command with proxy configuration
 
         Args:
             cmd: Command to execute
+            timeout: Timeout in seconds
+            capture_stdout: Whether to capture stdout, discarded if False
 
         Returns:
             Tuple of (stdout, stderr, returncode)
@@ -68,44 +200,201 @@ class SandboxExecutor:
             env["HTTP_PROXY"] = self.proxy
             env["HTTPS_PROXY"] = self.proxy
 
-        logger.info(f"Executing command with proxy: {' '.join(cmd)}")
+        logger.debug("Executing command with proxy: %s", cmd)
         if self.proxy:
             logger.info(f"Using proxy: {self.proxy}")
 
+        # Python opens fds non-inheritable, so keeping close_fds=False is safe
+        # and lets subprocess spawn via posix_spawn instead of fork+exec
         process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             env=env,
+            close_fds=False,
         )
 
         try:
-            stdout, stderr = process.communicate(timeout=self.default_timeout)
+            stdout, stderr = process.communicate(timeout=timeout)
             return stdout, stderr, process.returncode
         except subprocess.TimeoutExpired:
             process.kill()
-            raise RuntimeError(
-                f"Command execution timeout after {self.default_timeout} seconds"
-            )
+            raise RuntimeError(f"Command execution timeout after {timeout} seconds")
 
 
-logger = logging.getLogger(__name__)
+@dataclass
+class SofficeWorker:
+    """A LibreOffice user profile that serves one conversion at a time"""
+
+    index: int
+    profile_dir: str
+    conversions: int = 0
+
+    @property
+    def user_installation(self) -> str:
+        """Profile location in the form expected by -env:UserInstallation"""
+        return Path(self.profile_dir).as_uri()
+
+
+class SofficePool:
+    """Pool of LibreOffice profiles shared by all conversions in the process
+
+    soffice spends most of its cold start bootstrapping the user profile, and
+    two instances sharing one profile collide on its lock file. Each worker
+    keeps its own profile alive across conversions, so only the first
+    conversion on a worker pays for the bootstrap.
+    """
+
+    # Recreate a profile after this many conversions to bound its growth
+    MAX_CONVERSIONS_PER_PROFILE = 200
+
+    _instance: Optional["SofficePool"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, size: int):
+        try:
+            self._root = cache_dir(_SOFFICE_PROFILE_CACHE_NAME)
+            self._persistent = True
+        except OSError as e:
+            # Never load profiles from a directory someone else can write to
+            logger.warning(f"Not using persistent soffice profiles: {e}")
+            self._root = Path(tempfile.mkdtemp(prefix="soffice_pool_"))
+            atexit.register(shutil.rmtree, self._root, True)
+            self._persistent = False
+        # Lock files claiming the persistent profiles, held for the process life
+        self._claims = []
+
+        self._workers: "queue.Queue[SofficeWorker]" = queue.Queue(maxsize=size)
+        for i in range(size):
+            profile_dir = self._claim_profile(i)
+            self._workers.put(SofficeWorker(index=i, profile_dir=profile_dir))
+        logger.info(f"Created soffice pool with {size} worker(s) in {self._root}")
+
+    def _claim_profile(self, index: int) -> str:
+        """Claim the persistent profile of a worker
+
+        Another process sharing the cache dir may already be using it, in
+        which case the worker falls back to a profile private to this process.
+        """
+        profile_dir = self._root / f"worker-{index}"
+        if fcntl is None or not self._persistent:
+            return str(profile_dir)
+
+        claim = open(self._root / f"worker-{index}.lock", "w")
+        try:
+            fcntl.flock(claim, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            claim.close()
+            fallback_dir = tempfile.mkdtemp(prefix=f"soffice_worker-{index}_")
+            atexit.register(shutil.rmtree, fallback_dir, True)
+            logger.info(f"soffice profile {profile_dir} busy, using {fallback_dir}")
+            return fallback_dir
+
+        self._claims.append(claim)
+        return str(profile_dir)
+
+    @classmethod
+    def get(cls) -> "SofficePool":
+        """Get the process-wide pool, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(max(1, CONFIG.soffice_workers))
+        return cls._instance
+
+    @contextlib.contextmanager
+    def acquire(self, timeout: float) -> Iterator[SofficeWorker]:
+        """Borrow a worker for the duration of one soffice invocation
+
+        Args:
+            timeout: Seconds to wait for a free worker, which should cover the
+                longest time another caller can hold one
+
+        Raises:
+            RuntimeError: If no worker frees up within timeout, so callers
+                can fall back to another extraction method
+        """
+        try:
+            worker = self._workers.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No soffice worker available after {timeout} seconds")
+        try:
+            yield worker
+        finally:
+            worker.conversions += 1
+            if worker.conversions >= self.MAX_CONVERSIONS_PER_PROFILE:
+                logger.info(f"Recycling soffice profile of worker {worker.index}")
+                shutil.rmtree(worker.profile_dir, ignore_errors=True)
+                worker.conversions = 0
+            self._workers.put(worker)
+
+
+# soffice arguments of a DOC -> DOCX conversion, input paths are appended
+_SOFFICE_ARGV_TEMPLATE = (
+    "{soffice}",
+    "--headless",
+    "--norestore",
+    "--nologo",
+    "-env:UserInstallation={user_installation}",
+    "--convert-to",
+    "docx",
+    "--outdir",
+    "{outdir}",
+)
+
+
+def _soffice_convert_cmd(soffice: str, worker: SofficeWorker, outdir: str) -> List[str]:
+    """Build the soffice conversion command for a worker, without input paths"""
+    subs = {
+        "soffice": soffice,
+        "user_installation": worker.user_installation,
+        "outdir": outdir,
+    }
+    return [arg.format_map(subs) for arg in _SOFFICE_ARGV_TEMPLATE]
 
 
 class DocParser(Docx2Parser):
     """DOC document parser"""
 
+    # Maximum number of documents converted by one soffice invocation
+    MAX_BATCH_SIZE = 10
+
     def __init__(self, *args, **kwargs):
         """Initialize DOC parser with sandbox executor"""
         super().__init__(*args, **kwargs)
         self.sandbox_executor = SandboxExecutor()
 
+    def _worker_acquire_timeout(self) -> int:
+        """Seconds to wait for a soffice worker
+
+        A worker is held for at most one full batch conversion, whose timeout
+        scales with the batch size, so waiting less would give up on workers
+        that are about to free up.
+        """
+        return self.sandbox_executor.default_timeout * self.MAX_BATCH_SIZE
+
     def parse_into_text(self, content: bytes) -> Document:
         logger.info(f"Parsing DOC document, content size: {len(content)} bytes")
 
+        # A ZIP signature means the file is already Office Open XML (e.g. a
+        # .docx saved with a .doc name), which needs no soffice conversion
+        if content[:4] == _ZIP_SIGNATURE:
+            try:
+                logger.info("DOC content is Office Open XML, parsing it as DOCX")
+                document = super(Docx2Parser, self).parse_into_text(content)
+                if document.is_valid():
+                    return document
+                # e.g. an ODT or a damaged DOCX, which soffice may still read
+                logger.info("No text parsed as DOCX, falling back to conversion")
+            except Exception as e:
+                logger.warning(f"Failed to parse DOC content as DOCX: {e}")
+
+        # Key of the DOCX conversion cache, hashed once from the in-memory content
+        cache_key = _docx_cache_key(content)
+
         handle_chain = [
             # 1. Try to convert to docx format to extract images
-            self._parse_with_docx,
+            functools.partial(self._parse_with_docx, cache_key=cache_key),
             # 2. If image extraction is not needed or conversion failed,
             # try using antiword to extract text
             self._parse_with_antiword,
@@ -114,22 +403,140 @@ class DocParser(Docx2Parser):
             # self._parse_with_textract,
         ]
 
-        # Save byte content as a temporary file
-        with TempFileContext(content, ".doc") as temp_file_path:
+        # Save byte content as a temporary file, in RAM when there is room
+        temp_dir = ram_temp_dir(len(content))
+        with contextlib.ExitStack() as stack:
+            try:
+                temp_file_path = stack.enter_context(
+                    TempFileContext(content, ".doc", dir=temp_dir)
+                )
+            except OSError as e:
+                # The free space check races with other writers to the tmpfs
+                if temp_dir is None:
+                    raise
+                logger.warning(f"Failed to stage DOC in {temp_dir}, using disk: {e}")
+                temp_file_path = stack.enter_context(TempFileContext(content, ".doc"))
+
             for handle in handle_chain:
                 try:
                     document = handle(temp_file_path)
                     if document:
                         return document
                 except Exception as e:
-                    logger.warning(f"Failed to parse DOC with {handle.__name__} {e}")
+                    name = getattr(handle, "func", handle).__name__
+                    logger.warning(f"Failed to parse DOC with {name} {e}")
 
             return Document(content="")
 
-    def _parse_with_docx(self, temp_file_path: str) -> Document:
+    def parse_many(self, contents: List[bytes]) -> List[Document]:
+        """Parse several DOC documents with a single soffice invocation
+
+        Converting a batch in one soffice process pays its startup cost once
+        instead of once per document. Documents missing from the batch output,
+        those whose converted DOCX yields no text, ZIP-signed (already Office
+        Open XML) documents, or the whole batch if the conversion fails, are
+        parsed one by one with parse_into_text.
+
+        Parser dispatches single files to parse_into_text; this entry point is
+        for callers that hold several DOC documents at once.
+
+        Args:
+            contents: Byte contents of the DOC documents
+
+        Returns:
+            Parsed documents, in the same order as contents
+        """
+        logger.info(f"Parsing {len(contents)} DOC documents in one batch")
+
+        cache_keys = [_docx_cache_key(content) for content in contents]
+        docx_contents = [_load_cached_docx(key) for key in cache_keys]
+
+        # Office Open XML needs no conversion, parse_into_text reads it directly
+        misses = [
+            i
+            for i, docx_content in enumerate(docx_contents)
+            if not docx_content and contents[i][:4] != _ZIP_SIGNATURE
+        ]
+        soffice_path = self._try_find_soffice()
+        # Bounded batches keep the timeout and the cost of a failed batch small
+        for start in range(0, len(misses), self.MAX_BATCH_SIZE):
+            batch = misses[start : start + self.MAX_BATCH_SIZE]
+            if not soffice_path or len(batch) < 2:
+                break
+            try:
+                converted = self._convert_batch_to_docx(
+                    soffice_path, [contents[i] for i in batch]
+                )
+                for i, docx_content in zip(batch, converted):
+                    if docx_content:
+                        _store_cached_docx(cache_keys[i], docx_content)
+                        docx_contents[i] = docx_content
+            except Exception as e:
+                logger.warning(f"Batch DOC to DOCX conversion failed: {e}")
+
+        documents = []
+        for content, docx_content in zip(contents, docx_contents):
+            document = None
+            if docx_content:
+                try:
+                    document = super(Docx2Parser, self).parse_into_text(docx_content)
+                except Exception as e:
+                    logger.warning(f"Failed to parse converted DOCX: {e}")
+            if document is None or not document.is_valid():
+                document = self.parse_into_text(content)
+            documents.append(document)
+        return documents
+
+    def _convert_batch_to_docx(
+        self, soffice_path: str, contents: List[bytes]
+    ) -> List[Optional[bytes]]:
+        """Convert DOC contents to DOCX in one soffice run
+
+        Returns:
+            DOCX content for each input, or None where soffice produced nothing
+        """
+        root = _conversion_tmp_root()
+        with TempDirContext(root) as input_dir, TempDirContext(root) as output_dir:
+            input_paths = []
+            for i, content in enumerate(contents):
+                input_path = os.path.join(input_dir, f"doc_{i}.doc")
+                _write_new_file(input_path, content)
+                input_paths.append(input_path)
+
+            pool = SofficePool.get()
+            with pool.acquire(self._worker_acquire_timeout()) as worker:
+                cmd = _soffice_convert_cmd(soffice_path, worker, output_dir)
+                cmd.extend(input_paths)
+                # Scale the timeout with the batch so large batches are not killed
+                timeout = self.sandbox_executor.default_timeout * len(contents)
+                stdout, stderr, returncode = self.sandbox_executor.execute_in_sandbox(
+                    cmd, timeout=timeout, capture_stdout=False
+                )
+
+            if returncode != 0:
+                raise RuntimeError(
+                    f"soffice exited with {returncode}: "
+                    f"{stderr.decode('utf-8', errors='ignore')}"
+                )
+
+            # soffice keeps the input basename, so outputs pair up by index
+            docx_contents: List[Optional[bytes]] = []
+            for i in range(len(contents)):
+                output_path = os.path.join(output_dir, f"doc_{i}.docx")
+                if os.path.exists(output_path):
+                    with open(output_path, "rb") as f:
+                        docx_contents.append(f.read())
+                else:
+                    logger.warning(f"soffice produced no DOCX for batch item {i}")
+                    docx_contents.append(None)
+            return docx_contents
+
+    def _parse_with_docx(
+        self, temp_file_path: str, cache_key: Optional[str] = None
+    ) -> Document:
         logger.info("Multimodal enabled, attempting to extract images from DOC")
 
-        docx_content = self._try_convert_doc_to_docx(temp_file_path)
+        docx_content = self._try_convert_doc_to_docx(temp_file_path, cache_key)
         if not docx_content:
             raise RuntimeError("Failed to convert DOC to DOCX")
 
@@ -167,19 +574,32 @@ class DocParser(Docx2Parser):
         logger.info(f"Successfully extracted {len(text)} bytes of DOC using textract")
         return Document(content=str(text))
 
-    def _try_convert_doc_to_docx(self, doc_path: str) -> Optional[bytes]:
+    def _try_convert_doc_to_docx(
+        self, doc_path: str, cache_key: Optional[str] = None
+    ) -> Optional[bytes]:
         """Convert DOC file to DOCX format
 
         Uses LibreOffice/OpenOffice for conversion
 
         Args:
             doc_path: DOC file path
+            cache_key: Conversion cache key of the DOC content, computed from
+                the file if None
 
         Returns:
             Byte stream of DOCX file content, or None if conversion fails
         """
         logger.info(f"Converting DOC to DOCX: {doc_path}")
 
+        # The conversion is a pure function of the input, so re-ingesting the
+        # same document can reuse an earlier result
+        if cache_key is None:
+            with open(doc_path, "rb") as f:
+                cache_key = _docx_cache_key(f.read())
+        docx_content = _load_cached_docx(cache_key)
+        if docx_content:
+            return docx_content
+
         # Check if LibreOffice or OpenOffice is installed
         soffice_path = self._try_find_soffice()
         if not soffice_path:
@@ -189,20 +609,17 @@ class DocParser(Docx2Parser):
         logger.info(f"Using {soffice_path} to convert DOC to DOCX")
 
         # Create a temporary directory to store the converted file
-        with TempDirContext() as temp_dir:
-            cmd = [
-                soffice_path,
-                "--headless",
-                "--convert-to",
-                "docx",
-                "--outdir",
-                temp_dir,
-                doc_path,
-            ]
-            logger.info(f"Running command in sandbox: {' '.join(cmd)}")
+        root = _conversion_tmp_root()
+        pool, acquire_timeout = SofficePool.get(), self._worker_acquire_timeout()
+        with TempDirContext(root) as temp_dir, pool.acquire(acquire_timeout) as worker:
+            cmd = _soffice_convert_cmd(soffice_path, worker, temp_dir)
+            cmd.append(doc_path)
+            logger.debug("Running command in sandbox: %s", cmd)
 
             # Execute in sandbox with proxy configuration
-            stdout, stderr, returncode = self.sandbox_executor.execute_in_sandbox(cmd)
+            stdout, stderr, returncode = self.sandbox_executor.execute_in_sandbox(
+                cmd, capture_stdout=False
+            )
 
             if returncode != 0:
                 logger.warning(
@@ -210,26 +627,23 @@ class DocParser(Docx2Parser):
                 )
                 return None
 
-            # Find the converted file
-            docx_file = [
-                file for file in os.listdir(temp_dir) if file.endswith(".docx")
-            ]
-            logger.info(f"Found {len(docx_file)} DOCX file(s) in temporary directory")
-            for file in docx_file:
-                converted_file = os.path.join(temp_dir, file)
-                logger.info(f"Found converted file: {converted_file}")
-
-                # Read the converted file content
-                with open(converted_file, "rb") as f:
-                    docx_content = f.read()
-                    logger.info(
-                        f"Successfully read DOCX file, size: {len(docx_content)}"
-                    )
-                    return docx_content
-        return None
+            # soffice names the output after the input basename
+            converted_file = os.path.join(
+                temp_dir, Path(doc_path).with_suffix(".docx").name
+            )
+            if not os.path.exists(converted_file):
+                logger.warning(f"Converted file not found: {converted_file}")
+                return None
+
+            # Read the converted file content
+            with open(converted_file, "rb") as f:
+                docx_content = f.read()
+            logger.info(f"Successfully read DOCX file, size: {len(docx_content)}")
+            _store_cached_docx(cache_key, docx_content)
+            return docx_content
 
+    @staticmethod
     def _try_find_executable_path(
-        self,
         executable_name: str,
         possible_path: List[str] = [],
         environment_variable: List[str] = [],
@@ -266,9 +680,13 @@ class DocParser(Docx2Parser):
         logger.warning(f"Failed to find {executable_name}")
         return None
 
-    def _try_find_soffice(self) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _try_find_soffice() -> Optional[str]:
         """Find LibreOffice/OpenOffice executable path
 
+        The result is cached, as it does not change within the process.
+
         Returns:
             Executable path, or None if not found
         """
@@ -284,15 +702,19 @@ class DocParser(Docx2Parser):
             "C:\\Program Files\\LibreOffice\\program\\soffice.exe",
             "C:\\Program Files (x86)\\LibreOffice\\program\\soffice.exe",
         ]
-        return self._try_find_executable_path(
+        return DocParser._try_find_executable_path(
             executable_name="soffice",
             possible_path=possible_paths,
             environment_variable=["LIBREOFFICE_PATH"],
         )
 
-    def _try_find_antiword(self) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _try_find_antiword() -> Optional[str]:
         """Find antiword executable path
 
+        The result is cached, as it does not change within the process.
+
         Returns:
             Executable path, or None if not found
         """
@@ -305,7 +727,7 @@ class DocParser(Docx2Parser):
             "C:\\Program Files\\Antiword\\antiword.exe",
             "C:\\Program Files (x86)\\Antiword\\antiword.exe",
         ]
-        return self._try_find_executable_path(
+        return DocParser._try_find_executable_path(
             executable_name="antiword",
             possible_path=possible_paths,
             environment_variable=["ANTIWORD_PATH"],
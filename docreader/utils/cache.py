@@ -0,0 +1,152 @@
+import contextlib
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from docreader.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Seconds after which a leftover temporary file is considered abandoned
+_STALE_TMP_AGE = 3600
+# Fraction of the budget eviction goes down to, so rescans stay infrequent
+_EVICT_LOW_WATER = 0.9
+
+# Running total size of the entries of each cache directory, keyed by
+# (directory, suffix); guarded by _usage_lock, which serializes eviction
+_usage: Dict[Tuple[str, str], int] = {}
+_usage_lock = threading.Lock()
+
+
+def _cache_root() -> Path:
+    """
+    Get the root of the local caches
+    :return: DOCREADER_CACHE_DIR if set, otherwise the per-user cache directory
+    """
+    if CONFIG.cache_dir:
+        return Path(CONFIG.cache_dir)
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "weknora"
+    try:
+        return Path.home() / ".cache" / "weknora"
+    except RuntimeError:
+        # No resolvable home directory, e.g. an arbitrary uid in a container
+        uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+        return Path(tempfile.gettempdir()) / f"weknora-{uid}"
+
+
+def private_dir(path: Path) -> Path:
+    """
+    Create a directory only accessible to the current user, or check an existing one
+    :param path: Directory path
+    :return: The directory path
+    :raises PermissionError: If the path is a symlink, is owned by another user
+        or is writable by group or others
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if os.name == "nt":
+        return path
+
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f"Refusing to use {path}: not a directory")
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"Refusing to use {path}: owned by uid {st.st_uid}")
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"Refusing to use {path}: writable by other users")
+    return path
+
+
+def cache_dir(name: str) -> Path:
+    """
+    Get a cache subdirectory private to the current user, creating it if needed
+
+    Files in it are trusted (cached results, LibreOffice profiles), so both
+    the subdirectory and the cache root must not be writable by anyone else.
+    :param name: Subdirectory name
+    :return: Directory path
+    :raises PermissionError: If the directory or the cache root fails the checks
+    """
+    return private_dir(private_dir(_cache_root()) / name)
+
+
+def _scan_entries(directory: Path, suffix: str) -> List[Tuple[str, os.stat_result]]:
+    """
+    List the entries of a cache directory, removing abandoned temporary files
+    :param directory: Cache directory
+    :param suffix: File suffix of the cache entries
+    :return: List of (path, stat result) of the entries
+    """
+    entries = []
+    now = time.time()
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            if entry.name.endswith(suffix):
+                entries.append((entry.path, st))
+            elif entry.name.endswith(".tmp") and now - st.st_mtime > _STALE_TMP_AGE:
+                # Left behind by a write that crashed before its rename
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(entry.path)
+    return entries
+
+
+def _evict(directory: Path, suffix: str, target_bytes: int) -> int:
+    """
+    Delete the least recently used cache entries until they fit the target size
+    :param directory: Cache directory
+    :param suffix: File suffix of the cache entries
+    :param target_bytes: Total size of the entries to get down to
+    :return: Total size of the remaining entries in bytes
+    """
+    entries = _scan_entries(directory, suffix)
+    total = sum(st.st_size for _, st in entries)
+    if total <= target_bytes:
+        return total
+
+    # Readers touch entries on hits, so the oldest mtime is the least recently used
+    entries.sort(key=lambda entry: entry[1].st_mtime)
+    for path, st in entries:
+        if total <= target_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= st.st_size
+    logger.info(f"Evicted cache entries in {directory}, {total} bytes kept")
+    return total
+
+
+def evict_lru(directory: Path, suffix: str, added: int, max_bytes: int) -> None:
+    """
+    Account for a newly stored cache entry and evict old ones once over budget
+
+    A running total per directory avoids rescanning it on every store: the
+    directory is only scanned on first use and when the total exceeds the
+    budget, and eviction then goes down to a low-water mark.
+    :param directory: Cache directory
+    :param suffix: File suffix of the cache entries
+    :param added: Size in bytes of the entry just stored
+    :param max_bytes: Maximum total size of the entries in bytes
+    """
+    key = (str(directory), suffix)
+    with _usage_lock:
+        total = _usage.get(key)
+        if total is None:
+            # The first scan already counts the entry just stored
+            total = sum(st.st_size for _, st in _scan_entries(directory, suffix))
+        else:
+            total += added
+        if total > max_bytes:
+            total = _evict(directory, suffix, int(max_bytes * _EVICT_LOW_WATER))
+        _usage[key] = total
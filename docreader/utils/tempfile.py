@@ -1,28 +1,62 @@
 import logging
 import os
+import shutil
 import tempfile
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# tmpfs mount used for short-lived files handed to external tools (Linux only)
+RAM_TEMP_DIR = "/dev/shm"
+
+
+def ram_temp_dir(size: int) -> Optional[str]:
+    """
+    Get a RAM-backed temporary directory with room for a file of the given size
+    :param size: Size in bytes of the file to be written
+    :return: Directory path, or None to use the default temporary directory
+    """
+    if not os.path.isdir(RAM_TEMP_DIR):
+        return None
+    try:
+        # Keep headroom: /dev/shm is small in containers and shared with others
+        if shutil.disk_usage(RAM_TEMP_DIR).free < size * 2:
+            return None
+    except OSError:
+        return None
+    return RAM_TEMP_DIR
+
 
 class TempFileContext:
-    def __init__(self, file_content: bytes, suffix: str):
+    def __init__(self, file_content: bytes, suffix: str, dir: Optional[str] = None):
         """
         Initialize the context
         :param file_content: Byte data to write to file
         :param suffix: File suffix
+        :param dir: Directory to create the file in, system default if None
         """
         self.file_content = file_content
         self.suffix = suffix
+        self.dir = dir
         self.file = None
 
     def __enter__(self):
         """
         Create file when entering context
         """
-        self.temp_file = tempfile.NamedTemporaryFile(suffix=self.suffix, delete=False)
-        self.temp_file.write(self.file_content)
-        self.temp_file.flush()
+        self.temp_file = tempfile.NamedTemporaryFile(
+            suffix=self.suffix, dir=self.dir, delete=False
+        )
+        try:
+            self.temp_file.write(self.file_content)
+            self.temp_file.flush()
+        except BaseException:
+            # __exit__ does not run when __enter__ raises, so never leave a
+            # partial file behind (it would hold RAM on a tmpfs)
+            self.temp_file.close()
+            os.remove(self.temp_file.name)
+            self.temp_file = None
+            raise
         logger.info(
             f"Saved {self.suffix} content to temporary file: {self.temp_file.name}"
         )
@@ -42,17 +76,19 @@ class TempFileContext:
 
 
 class TempDirContext:
-    def __init__(self):
+    def __init__(self, dir: Optional[str] = None):
         """
         Initialize the context
+        :param dir: Parent directory to create the directory in, system default if None
         """
+        self.dir = dir
         self.temp_dir = None
 
     def __enter__(self):
         """
         Create directory when entering context
         """
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=self.dir)
         logger.info(f"Created temporary directory: {self.temp_dir.name}")
         return self.temp_dir.name
 